@@ -14,67 +14,99 @@ optical character recognition, three different APIs, json parsing, and more.
 """
 import config  # used to get the secret sensitive info needed for our APIs - not uploaded to GitHub for security purposes
 import os  # needed to get the file paths
-import random  # Used to pick a random keyword to search when grabbing a video
-import requests
+import requests  # only used here to catch a failed file size request
+from concurrent.futures import ThreadPoolExecutor  # used to check the file sizes of a page of videos all at once
 from pexels_api import API  # need this to get images to use from Pexels (our source of images for the project)
 from datetime import datetime  # used for date and time in the FB log posting, so we know when things were posted to FB
 from database import Database
+from posting_context import PostingContext
 from text_processing import Text_Processing
 from fb_posting import FB_Posting
+from image_processing import Image_Processing
 from nature_video import NatureVideo
 
+# How many pages of Pexels results we'll look through before giving up, so a search term with nothing left to post
+# can't keep us paging through the API forever.
+MAX_PAGES_TO_SEARCH = 10
+
+# How many file size (HEAD) requests we'll have going at the same time.
+FILE_SIZE_WORKERS = 8
+
 
 class Pexels_Video_Posting:
 
     @staticmethod
-    def process_videos(videos: list, attempted_posts: int, database, searched_term):
+    def process_videos(videos: list, context: PostingContext):
         """
         This is the function that primarily makes decisions with the videos.
         It goes through a series of if statements to figure out if the video
         is worth posting to FB or not based on a given criteria below.
         :param videos: list of videos to iterate through, retrieved from
         the next function below.
-        :param attempted_posts: This is an integer which will represent the number of times it posted to FB or not.
-        :param database: sqlite3 database file to add values to.
-        :param searched_term: The search key term that we used to search for the right video through pexels api search.
-        :returns: Spreadsheet values to send, this will evaluate to True and allow
-        the code to stop running once the post has been logged to the spreadsheet.
+        :param context: PostingContext with the database, the search term we used, bad words, and already posted IDs
+        for this run. It also keeps count of failed posts across pages.
+        :returns: The values we logged to the database, which will evaluate to True and allow
+        the code to stop running once the post has been logged. True if we gave up after 5 failed posts,
+        or False if nothing on this page could be posted.
         """
 
-        for video in videos:
+        # if we've picked 5 different videos, and they all fail to post to FB, there's probably something going on.
+        # in this case, if the function returns True, because of the done = False thing in the next function, it will
+        # kill the loop. In this case this is like a failsafe to make sure the script doesn't run forever in the case of
+        # some issue with FB servers.
+        if context.attempted_posts >= 5:
+            return True
 
-            current_video = NatureVideo(video)
-            
-            # if we've picked 5 different photos, and they all fail to post to FB, there's probably something going on.
-            # in this case, if the function returns True, because of the done = False thing in the next function, it will
-            # kill the loop. In this case this is like a failsafe to make sure the script doesn't run forever in the case of
-            # some issue with FB servers.
-            if attempted_posts >= 5:
-                return True
+        # First go through the checks that don't need the network, keeping the page order.
+        candidates = []
+        for video in videos:
 
             if not Text_Processing.acceptable_extension_for_video_posting(video.extension):
                 continue
 
-            if str(video.id) in database.retrieve_values_from_table_column('Nature_Bot_Logged_FB_Posts_Videos', 'ID'):
+            if str(video.id) in context.logged_ids:
                 continue
 
-            # make sure the file size is less than 1 GB. (This is primarily for FB posting limitations).
-            if current_video.too_large():
-                continue
+            # only wrap the video once the checks on the raw search result have passed
+            current_video = NatureVideo(video)
 
             # If the video is greater than 20 minutes long, start over. (also for FB Positing limitations)
             if current_video.too_long():
                 continue
 
-            if current_video.caption_contains_bad_words():
+            if current_video.caption_contains_bad_words(context.bad_words):
+                continue
+
+            candidates.append(current_video)
+
+        # Getting the file size is a HEAD request per video, so do them all at the same time instead of one by one.
+        with ThreadPoolExecutor(max_workers=FILE_SIZE_WORKERS) as executor:
+            file_size_requests = [executor.submit(Image_Processing.get_file_size, candidate.link)
+                                  for candidate in candidates]
+
+        for current_video, file_size_request in zip(candidates, file_size_requests):
+
+            # if one video's file size request fails, just skip that video instead of giving up on the whole page
+            try:
+                file_size = file_size_request.result()
+            except (requests.exceptions.RequestException, ValueError) as error:
+                print(f"Could not get the file size of video {current_video.id}: {error}")
+                continue
+
+            # same failsafe as above, for videos that failed to post earlier on this page
+            if context.attempted_posts >= 5:
+                return True
+
+            # make sure the file size is less than 1 GB. (This is primarily for FB posting limitations).
+            if current_video.too_large(file_size):
                 continue
 
-            post_to_fb_request = FB_Posting.post_video_to_fb(video)
+            post_to_fb_request = FB_Posting.post_video_to_fb(current_video)
             fb_post_id = Text_Processing.get_post_id_from_json(post_to_fb_request)
 
             if not fb_post_id:
                 print("Post was not successful")
-                attempted_posts += 1
+                context.attempted_posts += 1
                 continue
 
             else:
@@ -83,44 +115,44 @@ class Pexels_Video_Posting:
                 dt_string = str(datetime.now().strftime("%m/%d/%Y %H:%M:%S"))
 
                 data_to_log = (
-                    dt_string, str(post_to_fb_request), str(current_video.description), str(current_video.videographer),
-                    str(current_video.id), searched_term, int(current_video.duration), str(current_video.url),
-                    str(current_video.link), float(current_video.file_size),
+                    dt_string, str(fb_post_id), str(current_video.description), str(current_video.videographer),
+                    str(current_video.id), context.searched_term, int(current_video.duration), str(current_video.url),
+                    str(current_video.link), float(file_size),
                 )
 
-                database.log_to_DB(formatted_tuple=data_to_log,
-                                   table_to_add_values_to="Nature_Bot_Logged_FB_Posts_Videos")
+                context.database.log_to_DB(formatted_tuple=data_to_log,
+                                           table_to_add_values_to=context.logged_posts_table)
+                context.logged_ids.add(str(current_video.id))
                 print("Data has been logged to the database. All done!")
-                database.connect.close()
                 return data_to_log
 
+        # nothing on this page worked, so let main() know it should try the next page
+        return False
+
 
 def main():
     """
     This function does the actual searching of the videos.
     This function calls Pexels' API and pulls a list of videos
     to search through. If none of the videos meet our criteria,
-    then load the "next page" which is just another list of 15 videos
-    to search through.
+    then load the "next page" which is just another list of 80 videos
+    to search through, up to MAX_PAGES_TO_SEARCH pages.
     :returns: None
     """
 
-    global done
     CURRENT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
     db_path_and_name = os.path.join(CURRENT_DIRECTORY, "Nature_Bot_Data.db")
-    database_instance = Database(db_path_and_name)
-    PEXELS_API_KEY = config.secret_stuff['PEXELS_API_KEY']
-    api = API(PEXELS_API_KEY)
-    search_terms = database_instance.retrieve_values_from_table_column("Photo_Search_Terms", "Terms")
-    searched_term = str(random.choice(search_terms))
-    api.search_video(searched_term, page=1, results_per_page=15)
-
-    attempted_posts = 0
-    done = False
-    while not done:
-        done = Pexels_Video_Posting.process_videos(videos=api.get_video_entries(), attempted_posts=attempted_posts,
-                                                   database=database_instance, searched_term=searched_term)
-        if not done:
+    with Database(db_path_and_name) as database_instance:
+        context = PostingContext.load(database_instance, "Nature_Bot_Logged_FB_Posts_Videos")
+        PEXELS_API_KEY = config.secret_stuff['PEXELS_API_KEY']
+        api = API(PEXELS_API_KEY)
+        api.search_video(context.searched_term, page=1, results_per_page=80)
+
+        for page in range(1, MAX_PAGES_TO_SEARCH + 1):
+            done = Pexels_Video_Posting.process_videos(videos=api.get_video_entries(), context=context)
+            # stop if we're done, if this was the last page we'll look at, or if there are no more pages of results
+            if done or page == MAX_PAGES_TO_SEARCH or not api.has_next_page:
+                break
             api.search_next_page()
 
 
@@ -7,6 +7,21 @@ This way we can store the methods here and then call them later in other project
 The overall goal is to use OOP techniques to create clean, testable, and reusable code.
 """
 import sqlite3
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def insert_sql(table_name: str, number_of_values: int) -> str:
+    """
+    Builds the INSERT statement for a table with the given number of values, once per table and size.
+
+    :param table_name: The name of the table you want to insert into.
+    :param number_of_values: How many values (columns) each inserted row has.
+    :returns: INSERT statement string with one ? placeholder per value.
+    """
+
+    placeholders = ", ".join("?" * number_of_values)
+    return f'INSERT INTO {table_name} VALUES ({placeholders})'
 
 
 class Database:
@@ -16,14 +31,23 @@ class Database:
         self.connect = sqlite3.connect(file_path_and_name)
         self.cursor = self.connect.cursor()
 
+        # WAL + synchronous=NORMAL means one fsync per commit instead of two, which is plenty for a single writer.
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('PRAGMA synchronous=NORMAL')
+        self.cursor.execute('PRAGMA temp_store=MEMORY')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Always close the connection, even if the script errored out part way through.
+        self.connect.close()
+
     @property
     def table_names(self):
-        self.cursor.execute(f"""SELECT name FROM {self.file_path_and_name} WHERE type='table';""")
-        tuple_of_table_names = self.cursor.fetchall()
-
         # Returning it this way so that it returns a list of table names instead of a list of typles of table names.
         # Which in my opinion is cleaner and easier to parse through.
-        return [name for table_name in tuple_of_table_names for name in table_name]
+        return [name for (name,) in self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")]
 
     def log_to_DB(self, formatted_tuple: tuple, table_to_add_values_to: str):
         """
@@ -35,17 +59,8 @@ class Database:
 
         # The if is to make sure there is anything in the tuple at all, otherwise don't log anything to the database.
         if formatted_tuple:
-            if len(formatted_tuple) > 1:
-                formatted_string = "("
-                formatted_string += "?, " * (len(formatted_tuple) - 1)
-                formatted_string += "?)"
-                self.cursor.execute(f'INSERT INTO {table_to_add_values_to} VALUES {formatted_string}', formatted_tuple)
-                self.connect.commit()
-
-            elif len(formatted_tuple) == 1:
-                formatted_string = "(?)"
-                self.cursor.execute(f'INSERT INTO {table_to_add_values_to} VALUES {formatted_string}', formatted_tuple)
-                self.connect.commit()
+            with self.connect:
+                self.cursor.execute(insert_sql(table_to_add_values_to, len(formatted_tuple)), formatted_tuple)
 
     def retrieve_values_from_table_column(self, name_of_table_to_retrieve_from: str, name_of_column: str) -> list:
         """
@@ -56,7 +71,8 @@ class Database:
 
         :return: list of values as a list, not a list of tuples but just a 1D list of each item.
         """
-        self.cursor.execute(f'SELECT {name_of_column} FROM {name_of_table_to_retrieve_from}')
-        tuple_of_items = self.cursor.fetchall()
+        # Only the one column is selected, so each row is a 1-tuple we can unpack straight off the cursor
+        # instead of building the whole result with fetchall() and then flattening it.
+        query = f'SELECT {name_of_column} FROM {name_of_table_to_retrieve_from}'
+        return [item for (item,) in self.cursor.execute(query)]
 
-        return [item for table_item in tuple_of_items for item in table_item]
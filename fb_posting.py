@@ -3,30 +3,78 @@ Author: Logan Maupin
 
 The purpose of this module is to create a list of methods that will assist in posting to FB.
 """
-import requests
+import json
+from functools import lru_cache
+from urllib.parse import urlencode
 import facebook
 import config
+from http_session import HTTP
+
+
+@lru_cache(maxsize=None)
+def fb_graph() -> facebook.GraphAPI:
+    """
+    Builds one Graph API client for the whole run, sharing the pooled session the rest of this module posts with.
+    It's only built the first time it's needed, since photo captions normally go out in the same batch as the photo.
+
+    :returns: facebook GraphAPI client object
+    """
+
+    return facebook.GraphAPI(access_token=config.secret_stuff['FB_Access_Token'], session=HTTP)
 
 
 class FB_Posting:
 
+    @staticmethod
+    def pexels_photo_caption(photo_description, photo_permalink) -> str:
+        """
+        Builds the caption we put on every Pexels photo post.
+
+        :param photo_description: description of the photo, preferably a str type
+        :param photo_permalink: the link of the original pexels photo for credit
+        :returns: caption text for the FB post
+        """
+
+        GitHub_Link = 'https://github.com/Voltaic314/Nature-Poster'
+        return f'Description: {photo_description}\n\nPexels image link: {photo_permalink}\n\n' \
+               f'P.S. This Facebook post was created by a bot. To learn more about how it works, ' \
+               f'check out the GitHub page here: {GitHub_Link}'
+
     @staticmethod
     def post_photo_to_fb(photo: object):
         """
         This function posts to fb given a specific photo_url that
-        you wish to use.
+        you wish to use, and adds the caption to that post in the same request.
+        Both steps are sent as one Graph API batch request, where the caption edit
+        refers to the id of the photo post the first step creates.
         :param photo: image object from pexels api search
-        :returns: response from FB servers with the post id or an error
+        :returns: batch response from FB servers, a json list with one result per step, or an error
         """
 
         fb_page_id = "101111365975816"
-        post_url = f'https://graph.facebook.com/{fb_page_id}/photos'
+        caption = FB_Posting.pexels_photo_caption(photo.description, photo.url)
+        batch = [
+            {
+                "method": "POST",
+                "name": "create-photo",
+                "relative_url": f"{fb_page_id}/photos",
+                "body": urlencode({"url": photo.original}),
+                # FB leaves out the result of a step that a later step depends on unless we ask for it
+                "omit_response_on_success": False,
+            },
+            {
+                "method": "POST",
+                "relative_url": f"{fb_page_id}_{{result=create-photo:$.id}}",
+                "body": urlencode({"message": caption}),
+            },
+        ]
+
         payload = {
-            "url": photo.original,
+            "batch": json.dumps(batch),
             "access_token": config.secret_stuff['FB_Access_Token']
         }
 
-        post_to_fb_request = requests.post(post_url, data=payload)
+        post_to_fb_request = HTTP.post('https://graph.facebook.com', data=payload)
         return post_to_fb_request.text
 
     @staticmethod
@@ -52,7 +100,7 @@ class FB_Posting:
             "access_token": config.secret_stuff['FB_Access_Token']
         }
 
-        post_to_fb_request = requests.post(post_url, data=payload)
+        post_to_fb_request = HTTP.post(post_url, data=payload)
         return post_to_fb_request.text
 
     @staticmethod
@@ -67,13 +115,7 @@ class FB_Posting:
         """
 
         fb_page_id = "101111365975816"
-        GitHub_Link = 'https://github.com/Voltaic314/Nature-Poster'
-
-        # define fb variable for next line with our access info
-        fb = facebook.GraphAPI(access_token=config.secret_stuff['FB_Access_Token'])
 
         # edit caption of existing fb post we just made
-        fb.put_object(parent_object=f'{fb_page_id}_{post_id}', connection_name='',
-                      message=f'Description: {photo_description}\n\nPexels image link: {photo_permalink}\n\n'
-                              f'P.S. This Facebook post was created by a bot. To learn more about how it works, '
-                              f'check out the GitHub page here: {GitHub_Link}')
+        fb_graph().put_object(parent_object=f'{fb_page_id}_{post_id}', connection_name='',
+                              message=FB_Posting.pexels_photo_caption(photo_description, photo_permalink))
@@ -0,0 +1,27 @@
+"""
+Author: Logan Maupin
+
+The purpose of this module is to hold the one requests session that every other module uses for its web requests.
+Sharing a single session means the connections to Pexels and FB are kept alive and reused between calls, instead of
+doing a brand new TCP + TLS handshake for every photo or video we look at.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session() -> requests.Session:
+    """
+    Builds a requests session with a pooled adapter that retries connection errors a few times before giving up.
+    Retry only covers idempotent methods by default, so a POST to FB will never be sent twice.
+
+    :returns: requests session object ready to be used for GET / HEAD / POST requests.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    return session
+
+
+HTTP = build_session()
@@ -8,9 +8,9 @@ from PIL import Image
 import imagehash
 import pytesseract
 import cv2
-import requests
 import re
 import os
+from http_session import HTTP
 
 
 class Image_Processing:
@@ -28,7 +28,7 @@ class Image_Processing:
         """
 
         with open(filename, 'wb') as f:
-            f.write(requests.get(url).content)
+            f.write(HTTP.get(url).content)
 
     @staticmethod
     def hash_image(filename: str) -> str:
@@ -47,14 +47,26 @@ class Image_Processing:
         Gets file size of a file given the url for it.
 
         :param url: This is any url of a given file that you wish to get the file size of.
-        :returns: File size of a given file as a floating point number in kilobytes
+        :returns: File size of a given file as a floating point number in kilobytes, or infinity if the server errors
+        out or doesn't tell us the size, so that it fails any file size limit instead of slipping past it.
         """
 
-        # grabbing data from our selected url
-        requests_content_length = requests.get(url)
+        # a HEAD request gives us the headers without downloading the file itself
+        response = HTTP.head(url, allow_redirects=True, timeout=10)
+        content_length = response.headers.get('content-length')
+
+        # some CDNs don't answer HEAD requests properly, so stream a GET instead and close it before reading the body
+        if not response.ok or content_length is None:
+            response = HTTP.get(url, stream=True, timeout=10)
+            content_length = response.headers.get('content-length')
+            response.close()
+
+        # an error page has its own content-length, which isn't the size of the file we asked about
+        if not response.ok or content_length is None:
+            return float('inf')
 
         # divides file size by 1000, so we can get how many kilobytes it is
-        length = float(requests_content_length.headers.get('content-length')) / 1000
+        length = float(content_length) / 1000
 
         return length
 
@@ -5,8 +5,8 @@ The purpose of this module is to house the nature photo class object.
 It's primarily just an extension of the Pexels API photo class objects.
 '''
 import os
+from functools import cached_property
 from pexels_api import photo
-from database import Database
 from image_processing import Image_Processing
 from text_processing import Text_Processing
 
@@ -14,28 +14,28 @@ class NaturePhoto(photo):
 
     def __init__(self) -> None:
         super().__init__(self)
+        # the description comes from the url slug, so put the spaces back in for the FB caption
         self.description = self.description.replace("-", " ")
-        self.description_words = self.description.split(" ")
-        self.file_size = Image_Processing.get_file_size(photo.original)
-        self.cwd = os.path.dirname(os.path.abspath(__file__))
-        db_path_and_name = os.path.join(self.cwd, "Nature_Bot_Data.db")
-        self.database = Database(db_path_and_name)
 
-    def caption_has_bad_words(self) -> bool:
-        bad_words_list = self.database.retrieve_values_from_table_column("Bad_Words", "Bad_Words")
-        return any(word in self.description_words for word in bad_words_list)
+    @cached_property
+    def file_size(self) -> float:
+        # network request, so it's only made the first time we ask for it and then kept
+        return Image_Processing.get_file_size(self.original)
+
+    def caption_has_bad_words(self, bad_words: frozenset) -> bool:
+        return Text_Processing.there_are_badwords_in_slug(self.description, bad_words)
     
     def is_too_large(self) -> bool:
         return self.file_size >= 4_000
     
-    def has_been_posted_to_FB_before(self) -> bool:
-        previous_post_ids = self.database.retrieve_values_from_table_column('Nature_Bot_Logged_FB_Posts', 'ID')
-        return str(self.id) in previous_post_ids
+    def has_been_posted_to_FB_before(self, logged_ids: set) -> bool:
+        return str(self.id) in logged_ids
     
     def unacceptable_extension(self) -> bool:
         return not Text_Processing.acceptable_extension_for_photo_posting(self.extension)
     
-    @property
+    # cached like file_size, since getting it means downloading the whole image
+    @cached_property
     def hash_str(self) -> str:
             # download the image
             Image_Processing.write_image(self.original, "image.jpg")
@@ -45,5 +45,5 @@ class NaturePhoto(photo):
             os.remove("image.jpg")
             return hash_str
     
-    def hash_in_db_already(self) -> bool:
-        return self.hash_str in self.database.retrieve_values_from_table_column('Nature_Bot_Logged_FB_Posts', 'Image_Hash')
\ No newline at end of file
+    def hash_in_db_already(self, logged_hashes: set) -> bool:
+        return self.hash_str in logged_hashes
\ No newline at end of file
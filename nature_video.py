@@ -3,28 +3,22 @@ Author: Logan Maupin
 
 The purpose of this module is to house the functionality for the Nature Video class object.
 '''
-import requests
-import os
-from database import Database
 from pexels_api import video
+from text_processing import Text_Processing
 
 
 class NatureVideo(video):
 
     def __init__(self) -> None:
         super().__init__(self)
-        self.cwd = os.path.dirname(os.path.abspath(__file__))
-        db_path_and_name = os.path.join(self.cwd, "Nature_Bot_Data.db")
-        self.database = Database(db_path_and_name)
-        self.file_size = float(requests.get(self.url).headers.get('content-length'))
-    
-    def too_large(self) -> bool:
-        return self.file_size >= 1_000_000
+
+    def too_large(self, file_size: float) -> bool:
+        # file_size is in kilobytes, from Image_Processing.get_file_size on the video file link (not the page url)
+        return file_size >= 1_000_000
 
     def too_long(self) -> bool:
         return self.duration >= 1_200
     
-    def caption_contains_bad_words(self) -> bool:
-        bad_words_list = self.database.retrieve_values_from_table_column("Bad_Words", "Bad_Words")
-        return any(word for word in self.description.lower().split(" ") if word in bad_words_list)
+    def caption_contains_bad_words(self, bad_words: frozenset) -> bool:
+        return Text_Processing.there_are_badwords(self.description, bad_words)
     
@@ -0,0 +1,49 @@
+'''
+Author: Logan Maupin
+
+The purpose of this module is to house the posting context class object. It bundles up everything a single posting
+run needs (the database, the search term, and the lookups we load once at startup) so that it can be passed around
+instead of living in global variables. That way each run, or each search term, gets its own state.
+'''
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+from database import Database
+from text_processing import Text_Processing
+
+
+@dataclass
+class PostingContext:
+    database: Database
+    logged_posts_table: str
+    searched_term: str
+    bad_words: frozenset
+    logged_ids: set
+    logged_hashes: set = field(default_factory=set)
+    attempted_posts: int = 0
+
+    @classmethod
+    def load(cls, database: Database, logged_posts_table: str, hash_column: Optional[str] = None) -> 'PostingContext':
+        """
+        Reads everything a posting run needs from the database once, and picks a random search term to use.
+
+        :param database: This represents the database class instance from the database.py file.
+        :param logged_posts_table: The name of the table we log our FB posts to, and check for posts we've made before.
+        :param hash_column: The name of the column in that table with the image hashes of what we've posted, if it has
+        one. Leave it as None for tables without hashes, like the videos table.
+        :returns: PostingContext instance ready to be passed to process_photos / process_videos.
+        """
+
+        search_terms = database.retrieve_values_from_table_column("Photo_Search_Terms", "Terms")
+        bad_words = frozenset(word.lower() for word in
+                              database.retrieve_values_from_table_column("Bad_Words", "Bad_Words"))
+        for word in Text_Processing.bad_words_that_never_match(bad_words):
+            print(f'Warning: the bad word "{word}" can never match a caption, it is not a single word.')
+        logged_ids = {str(post_id) for post_id in database.retrieve_values_from_table_column(logged_posts_table, 'ID')}
+        logged_hashes = set()
+        if hash_column:
+            logged_hashes = set(database.retrieve_values_from_table_column(logged_posts_table, hash_column))
+
+        return cls(database=database, logged_posts_table=logged_posts_table,
+                   searched_term=str(random.choice(search_terms)), bad_words=bad_words, logged_ids=logged_ids,
+                   logged_hashes=logged_hashes)
@@ -6,9 +6,14 @@ The following is a test script for nature poster script.
 Certain functions are left out of testing for now while I work on a way to figure out how to test them.
 """
 
+import json
+import os
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 from Nature_Poster_Photos import *
+from image_processing import Image_Processing
+from posting_context import PostingContext
 
 
 class TestNatureBot(unittest.TestCase):
@@ -25,6 +30,28 @@ class TestNatureBot(unittest.TestCase):
 
             self.assertTrue(["This", "sentence", "contains", "no", "bad", "words"])
 
+    def test_there_are_badwords(self):
+        bad_words = frozenset(("man", "car"))
+        self.assertTrue(Text_Processing.there_are_badwords("A man standing by the lake", bad_words))
+        self.assertTrue(Text_Processing.there_are_badwords("Sunset, with a CAR.\nOn the road", bad_words))
+        self.assertFalse(Text_Processing.there_are_badwords("Snowy mountain at sunrise", bad_words))
+        self.assertTrue(Text_Processing.there_are_badwords(["Man", "lake"], ["MAN"]))
+
+    def test_there_are_badwords_with_hyphens_numbers_and_accents(self):
+        bad_words = frozenset(("pre-owned", "18+", "ana"))
+        self.assertTrue(Text_Processing.there_are_badwords("A pre-owned boat on the lake", bad_words))
+        self.assertTrue(Text_Processing.there_are_badwords("Sunset x 18+ y", bad_words))
+        # "mañana" is one word, so it shouldn't match the bad word "ana"
+        self.assertFalse(Text_Processing.there_are_badwords("Mañana en la playa", bad_words))
+        self.assertEqual(Text_Processing.bad_words_that_never_match(["man", "pre-owned", "ice cream", "wow!"]),
+                         ["ice cream", "wow!"])
+
+    def test_there_are_badwords_in_slug(self):
+        bad_words = frozenset(("pre-owned", "man"))
+        self.assertTrue(Text_Processing.there_are_badwords_in_slug("a pre owned boat on the lake", bad_words))
+        self.assertTrue(Text_Processing.there_are_badwords_in_slug("a-man-by-the-lake", bad_words))
+        self.assertFalse(Text_Processing.there_are_badwords_in_slug("pre dawn owned by nobody", bad_words))
+
     # I want to somehow mock patch this in unittest but I'm not sure how I could make this work.
     # This test will fail if you run it offline.
     # TODO: figure out how to unittest this without pinging a specific web server, for now this will do
@@ -45,14 +72,51 @@ class TestNatureBot(unittest.TestCase):
     def test_get_file_size(self):
         self.assertEqual(get_file_size("https://raw.githubusercontent.com/Voltaic314/Nature-Poster/main/test_photo_for_hashing.jpg"), 146.168)
 
+    @patch("image_processing.HTTP")
+    def test_get_file_size_from_head_request(self, mock_http):
+        mock_http.head.return_value = MagicMock(ok=True, headers={'content-length': '146168'})
+        self.assertEqual(Image_Processing.get_file_size("https://example.com/photo.jpg"), 146.168)
+        mock_http.get.assert_not_called()
+
+    @patch("image_processing.HTTP")
+    def test_get_file_size_falls_back_to_get(self, mock_http):
+        mock_http.head.return_value = MagicMock(ok=False, headers={})
+        mock_http.get.return_value = MagicMock(ok=True, headers={'content-length': '2000'})
+        self.assertEqual(Image_Processing.get_file_size("https://example.com/video.mp4"), 2.0)
+        mock_http.get.return_value.close.assert_called_once()
+
+    @patch("image_processing.HTTP")
+    def test_get_file_size_is_infinite_when_unknown(self, mock_http):
+        # both requests fail with an error page that has its own content-length
+        mock_http.head.return_value = MagicMock(ok=False, headers={'content-length': '150'})
+        mock_http.get.return_value = MagicMock(ok=False, headers={'content-length': '150'})
+        self.assertEqual(Image_Processing.get_file_size("https://example.com/missing.mp4"), float('inf'))
+
+        # both requests work but neither one tells us the size
+        mock_http.head.return_value = MagicMock(ok=True, headers={})
+        mock_http.get.return_value = MagicMock(ok=True, headers={})
+        self.assertEqual(Image_Processing.get_file_size("https://example.com/unknown.mp4"), float('inf'))
+
     def test_acceptable_extension(self):
+        acceptable_extension = Text_Processing.acceptable_extension_for_photo_posting
         self.assertTrue(acceptable_extension("jpg"))
         self.assertTrue(acceptable_extension("jpeg"))
         self.assertTrue(acceptable_extension("png"))
         self.assertTrue(acceptable_extension("webp"))
+        self.assertTrue(acceptable_extension("JPG"))
         self.assertFalse(acceptable_extension("gif"))
-        self.assertFalse("bmp")
-        self.assertFalse("mp4")
+        self.assertFalse(acceptable_extension("bmp"))
+        self.assertFalse(acceptable_extension("mp4"))
+        # it used to be a substring check, so anything containing "png" passed
+        self.assertFalse(acceptable_extension("pngx"))
+
+    def test_acceptable_extension_for_video_posting(self):
+        acceptable_extension = Text_Processing.acceptable_extension_for_video_posting
+        self.assertTrue(acceptable_extension("mp4"))
+        self.assertTrue(acceptable_extension("MOV"))
+        self.assertFalse(acceptable_extension("gif"))
+        self.assertFalse(acceptable_extension("jpg"))
+        self.assertFalse(acceptable_extension("mp4a"))
 
     # I don't have a test for this yet so for now it passes.
     def test_post_to_fb(self):
@@ -65,7 +129,42 @@ class TestNatureBot(unittest.TestCase):
     def test_get_post_id_from_json(self):
         pass
 
+    def test_get_post_id_from_batch_json(self):
+        photo_step = {"code": 200, "body": '{"id": "12345", "post_id": "101111365975816_12345"}'}
+        caption_step = {"code": 200, "body": '{"success": true}'}
+        failed_step = {"code": 400, "body": '{"error": {"message": "Invalid parameter"}}'}
+
+        both_worked = json.dumps([photo_step, caption_step])
+        self.assertEqual(Text_Processing.get_post_id_from_batch_json(both_worked), "12345")
+        self.assertIsNotNone(Text_Processing.get_batch_step_result(both_worked, 1))
+
+        caption_failed = json.dumps([photo_step, failed_step])
+        self.assertEqual(Text_Processing.get_post_id_from_batch_json(caption_failed), "12345")
+        self.assertIsNone(Text_Processing.get_batch_step_result(caption_failed, 1))
+
+        self.assertIsNone(Text_Processing.get_post_id_from_batch_json(json.dumps([failed_step, None])))
+        self.assertIsNone(Text_Processing.get_post_id_from_batch_json('{"error": {"message": "Invalid token"}}'))
+
     # again, this requires sending post requests to FB API so I'm not really sure how I would test this yet.
     def test_edit_fb_post_caption(self):
         pass
 
+    def test_posting_context_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with Database(os.path.join(temp_dir, "test.db")) as database:
+                database.cursor.execute("CREATE TABLE Photo_Search_Terms (Terms TEXT)")
+                database.cursor.execute("CREATE TABLE Bad_Words (Bad_Words TEXT)")
+                database.cursor.execute("CREATE TABLE Logged_Posts (ID INTEGER, Image_Hash TEXT)")
+                database.cursor.execute("INSERT INTO Photo_Search_Terms VALUES ('lake')")
+                database.cursor.executemany("INSERT INTO Bad_Words VALUES (?)", [("Man",), ("CAR",)])
+                database.cursor.executemany("INSERT INTO Logged_Posts VALUES (?, ?)", [(123, "abc"), (456, "def")])
+                database.connect.commit()
+
+                context = PostingContext.load(database, "Logged_Posts", hash_column="Image_Hash")
+                self.assertEqual(context.searched_term, "lake")
+                self.assertEqual(context.bad_words, frozenset(("man", "car")))
+                self.assertEqual(context.logged_ids, {"123", "456"})
+                self.assertEqual(context.logged_hashes, {"abc", "def"})
+                self.assertEqual(context.attempted_posts, 0)
+
+                self.assertEqual(PostingContext.load(database, "Logged_Posts").logged_hashes, set())
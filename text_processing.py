@@ -5,6 +5,15 @@ The point of this module is to provide a collection of text manipulation methods
 nature poster photo / video modules.
 """
 import json
+import re
+
+ACCEPTABLE_PHOTO_EXTENSIONS = frozenset(('jpg', 'jpeg', 'png', 'webp'))
+ACCEPTABLE_VIDEO_EXTENSIONS = frozenset(('mp4', 'mov', 'wmv', 'avi'))
+
+# compiled once, used to pull the words out of lowercase text no matter what's between them (spaces, newlines, etc.)
+# A word is any run of unicode letters, digits, apostrophes, hyphens and plus signs, so "pre-owned", "18+" and "mañana"
+# each stay one word. A bad word can only ever match if it's a single word by this same pattern.
+WORD_PATTERN = re.compile(r"[\w'+-]+")
 
 
 class Text_Processing:
@@ -14,30 +23,26 @@ class Text_Processing:
     @staticmethod
     def acceptable_extension_for_photo_posting(file_extension: str) -> bool:
         """
-        This function defines the list of acceptable photo extensions
-        we can use. It also tells us whether the one we want to use is
-        in the acceptable list of extensions.
+        This function tells us whether the photo extension we want to use is
+        in the acceptable set of extensions defined at the top of this module.
         :param file_extension: The end of an image url of an image hosted online.
         :returns: True / False of whether the photo extension matches an
         acceptable format.
         """
 
-        extensions = ['jpg', 'jpeg', 'png', 'webp']
-        return any(extensions in file_extension for extensions in extensions)
+        return file_extension.lower() in ACCEPTABLE_PHOTO_EXTENSIONS
 
     @staticmethod
-    def acceptable_extension_for_video_posting(video_extension: str):
+    def acceptable_extension_for_video_posting(video_extension: str) -> bool:
         """
-        This function defines the list of acceptable video extensions
-        we can use. It also tells us whether the one we want to use is
-        in the acceptable list of extensions.
+        This function tells us whether the video extension we want to use is
+        in the acceptable set of extensions defined at the top of this module.
         :param video_extension: The end of an image url of an image hosted online.
         :returns: True / False of whether the video extension matches an
         acceptable format.
         """
 
-        extensions = ['mp4', 'mov', 'wmv', 'avi']
-        return any(extensions in video_extension for extensions in extensions)
+        return video_extension.lower() in ACCEPTABLE_VIDEO_EXTENSIONS
 
     @staticmethod
     def get_post_id_from_json(api_web_request: str):
@@ -52,18 +57,92 @@ class Text_Processing:
         id_from_json = return_text_dict.get('id')
         return id_from_json
 
+    @staticmethod
+    def get_batch_step_result(api_web_request: str, step: int):
+        """
+        This function takes the response from a FB batch request and returns the
+        result of the given step, if that step succeeded.
+        :param api_web_request: json response from FB, a list with one result per batch step
+        :param step: index of the batch step you want the result of, starting at 0
+        :returns: dict with the step's code, headers and body, or None if the batch or that step failed
+        """
+
+        batch_results = json.loads(api_web_request)
+
+        # if the whole batch fails FB sends back a single error object instead of a list
+        if not isinstance(batch_results, list) or len(batch_results) <= step or not batch_results[step]:
+            return None
+
+        step_result = batch_results[step]
+        if step_result.get('code') != 200:
+            return None
+
+        return step_result
+
+    @staticmethod
+    def get_post_id_from_batch_json(api_web_request: str):
+        """
+        This function takes the response from a FB batch request and parses out
+        the post ID from the result of the first step in the batch.
+        :param api_web_request: json response from FB, a list with one result per batch step
+        :returns: post id string, or None if the batch or its first step failed
+        """
+
+        first_result = Text_Processing.get_batch_step_result(api_web_request, 0)
+        if first_result is None:
+            return None
+
+        return Text_Processing.get_post_id_from_json(first_result.get('body', '{}'))
+
+    @staticmethod
+    def bad_words_that_never_match(bad_words_list) -> list[str]:
+        """
+        Finds the bad words that there_are_badwords can never match on a string, because WORD_PATTERN would never
+        pull them out of any text as a single word (for example, anything with a space or a "!" in it).
+
+        :param bad_words_list: bad words you want to check
+        :returns: list of the bad words that will never match, empty if they're all fine
+        """
+
+        return [word for word in bad_words_list if not WORD_PATTERN.fullmatch(word.lower())]
+
     @staticmethod
     def there_are_badwords(text_list: list[str], bad_words_list: list[str]) -> bool:
         """
-        Simple list comprehension to check if the given text list contains bad words or not.
+        Checks if the given text list contains bad words or not, ignoring case.
 
-        :param text_list: list of all the words you want to check. If you're checking a string, split it somehow, then
-        pass it into this function. If not I did do a simple str.split() to help with this at least.
-        :param bad_words_list: list of bad words you want to use
+        :param text_list: list of all the words you want to check. You can also pass a string, in which case the words
+        are pulled out of it with WORD_PATTERN, so punctuation and newlines don't hide a bad word.
+        :param bad_words_list: bad words you want to use. If you pass a set or frozenset, its words should already be
+        lowercase, that way it can be used as is without being rebuilt on every call.
         :returns: True if any of words in the text list match the bad words list words
         """
 
         if isinstance(text_list, str):
-            text_list = text_list.lower().split()
+            words = WORD_PATTERN.findall(text_list.lower())
+        else:
+            words = (word.lower() for word in text_list)
+
+        if not isinstance(bad_words_list, (set, frozenset)):
+            bad_words_list = {word.lower() for word in bad_words_list}
+
+        return not bad_words_list.isdisjoint(words)
+
+    @staticmethod
+    def there_are_badwords_in_slug(slug_text: str, bad_words_list: list[str]) -> bool:
+        """
+        Same check as there_are_badwords, but for text made from a url slug, like Pexels photo descriptions. Slugs turn
+        every space into a hyphen, so "pre-owned" and "pre owned" look the same. Any bad word with a hyphen in it is
+        matched against that run of words instead.
+
+        :param slug_text: the text you want to check, with or without its hyphens already replaced by spaces
+        :param bad_words_list: bad words you want to use, same as there_are_badwords
+        :returns: True if any of the words, or runs of words, in the text match the bad words list words
+        """
+
+        words = WORD_PATTERN.findall(slug_text.lower().replace("-", " "))
+        if Text_Processing.there_are_badwords(words, bad_words_list):
+            return True
 
-        return any(word.lower() in text_list for word in bad_words_list)
+        text = f' {" ".join(words)} '
+        return any(f' {word.lower().replace("-", " ")} ' in text for word in bad_words_list if "-" in word)